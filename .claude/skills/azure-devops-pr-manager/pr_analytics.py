@@ -1,9 +1,19 @@
 """PR Analytics - Calculate metrics and trends"""
 
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from datetime import datetime
-from collections import defaultdict
-import statistics
+from collections import Counter
+import math
+import sys
+
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts the trailing 'Z' natively; no per-timestamp copy
+    _parse_timestamp = datetime.fromisoformat
+else:
+    def _parse_timestamp(value: str) -> datetime:
+        """Parse an Azure DevOps ISO-8601 timestamp"""
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
 
 
 class PRAnalytics:
@@ -14,80 +24,90 @@ class PRAnalytics:
         if not prs:
             return {'error': 'No PRs to analyze'}
 
+        # Single pass over the PRs; every metric is derived from these tallies
+        status_counts = Counter()
+        size_counts = Counter()
+        author_counts = Counter()
+        reviewer_counts = Counter()
+        spans = []
+        for pr in prs:
+            status = pr.get('status')
+            status_counts[status] += 1
+            size_counts[self._size_bucket(pr.get('lines_changed', 0))] += 1
+            author_counts[pr.get('createdBy', {}).get('displayName', 'Unknown')] += 1
+            reviewer_counts.update(
+                reviewer.get('displayName', 'Unknown') for reviewer in pr.get('reviewers', [])
+            )
+            if status == 'completed':
+                spans.append((pr.get('creationDate'), pr.get('closedDate')))
+
         metrics = {
             'total_prs': len(prs),
-            'completed': sum(1 for pr in prs if pr.get('status') == 'completed'),
-            'active': sum(1 for pr in prs if pr.get('status') == 'active'),
-            'abandoned': sum(1 for pr in prs if pr.get('status') == 'abandoned'),
-            'cycle_times': self._calculate_cycle_times(prs),
-            'size_distribution': self._calculate_size_distribution(prs),
-            'top_reviewers': self._calculate_top_reviewers(prs),
-            'top_contributors': self._calculate_top_contributors(prs),
+            'completed': status_counts['completed'],
+            'active': status_counts['active'],
+            'abandoned': status_counts['abandoned'],
+            'cycle_times': self._calculate_cycle_times(spans),
+            'size_distribution': self._calculate_size_distribution(size_counts, len(prs)),
+            'top_reviewers': self._top_ranked(reviewer_counts),
+            'top_contributors': self._top_ranked(author_counts),
         }
 
         return metrics
 
-    def _calculate_cycle_times(self, prs: List[Dict]) -> Dict:
-        """Calculate PR cycle time metrics"""
-        cycle_times = []
+    def _calculate_cycle_times(self, spans: List[Tuple[str, str]]) -> Dict:
+        """Calculate PR cycle time metrics from (creationDate, closedDate) pairs"""
+        parse = _parse_timestamp
+        cycle_times = [
+            (parse(closed) - parse(created)).total_seconds() / 3600
+            for created, closed in spans
+            if created and closed
+        ]
 
-        for pr in prs:
-            if pr.get('status') != 'completed':
-                continue
-
-            created = pr.get('creationDate')
-            closed = pr.get('closedDate')
-
-            if created and closed:
-                created_dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
-                closed_dt = datetime.fromisoformat(closed.replace('Z', '+00:00'))
-                hours = (closed_dt - created_dt).total_seconds() / 3600
-                cycle_times.append(hours)
+        return self._cycle_time_stats(cycle_times)
 
+    def _cycle_time_stats(self, cycle_times: List[float]) -> Dict:
+        """Compute average/median/p95 from one sorted copy of the cycle times"""
         if not cycle_times:
             return {'average': 0, 'median': 0, 'p95': 0}
 
-        return {
-            'average': round(statistics.mean(cycle_times), 1),
-            'median': round(statistics.median(cycle_times), 1),
-            'p95': round(sorted(cycle_times)[int(len(cycle_times) * 0.95)], 1) if len(cycle_times) > 1 else 0,
-        }
+        ordered = sorted(cycle_times)
+        count = len(ordered)
+        mid = count // 2
+        median = ordered[mid] if count % 2 else (ordered[mid - 1] + ordered[mid]) / 2
 
-    def _calculate_size_distribution(self, prs: List[Dict]) -> Dict:
-        """Calculate PR size distribution"""
-        small = sum(1 for pr in prs if pr.get('lines_changed', 0) < 100)
-        medium = sum(1 for pr in prs if 100 <= pr.get('lines_changed', 0) < 500)
-        large = sum(1 for pr in prs if pr.get('lines_changed', 0) >= 500)
+        # p95 with linear interpolation between closest ranks
+        rank = (count - 1) * 0.95
+        lower = int(rank)
+        upper = min(lower + 1, count - 1)
+        p95 = ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
 
-        total = len(prs)
         return {
-            'small': {'count': small, 'percent': round(small / total * 100) if total > 0 else 0},
-            'medium': {'count': medium, 'percent': round(medium / total * 100) if total > 0 else 0},
-            'large': {'count': large, 'percent': round(large / total * 100) if total > 0 else 0},
+            'average': round(math.fsum(ordered) / count, 1),
+            'median': round(median, 1),
+            'p95': round(p95, 1),
         }
 
-    def _calculate_top_reviewers(self, prs: List[Dict]) -> List[Dict]:
-        """Calculate top reviewers"""
-        reviewer_counts = defaultdict(int)
-
-        for pr in prs:
-            for reviewer in pr.get('reviewers', []):
-                name = reviewer.get('displayName', 'Unknown')
-                reviewer_counts[name] += 1
-
-        top = sorted(reviewer_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-        return [{'name': name, 'count': count} for name, count in top]
+    def _size_bucket(self, lines_changed: int) -> str:
+        """Classify a PR by lines changed"""
+        if lines_changed < 100:
+            return 'small'
+        if lines_changed < 500:
+            return 'medium'
+        return 'large'
 
-    def _calculate_top_contributors(self, prs: List[Dict]) -> List[Dict]:
-        """Calculate top PR authors"""
-        author_counts = defaultdict(int)
-
-        for pr in prs:
-            author = pr.get('createdBy', {}).get('displayName', 'Unknown')
-            author_counts[author] += 1
+    def _calculate_size_distribution(self, size_counts: Counter, total: int) -> Dict:
+        """Calculate PR size distribution from per-bucket counts"""
+        return {
+            bucket: {
+                'count': size_counts[bucket],
+                'percent': round(size_counts[bucket] / total * 100) if total > 0 else 0,
+            }
+            for bucket in ('small', 'medium', 'large')
+        }
 
-        top = sorted(author_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-        return [{'name': name, 'count': count} for name, count in top]
+    def _top_ranked(self, counts: Counter, limit: int = 5) -> List[Dict]:
+        """Top names by count (reviewers or PR authors)"""
+        return [{'name': name, 'count': count} for name, count in counts.most_common(limit)]
 
 
 def calculate_pr_metrics(prs: List[Dict]) -> Dict:
@@ -6,10 +6,33 @@ Generates and saves GitHub bug report markdown files to user-specified directori
 
 import os
 import re
-from typing import Dict, Any
+import string
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, List, Tuple
 from datetime import datetime
 
 
+class _FilenameTable(dict):
+    """str.translate table: keeps a-z/0-9 and maps everything else to '-'"""
+
+    def __missing__(self, codepoint: int) -> str:
+        # Only reached for non-ASCII characters; ASCII is pre-populated
+        return '-'
+
+
+_ALLOWED_FILENAME_CHARS = frozenset(string.ascii_lowercase + string.digits)
+_FILENAME_TABLE = _FilenameTable(
+    (i, chr(i) if chr(i) in _ALLOWED_FILENAME_CHARS else '-') for i in range(128)
+)
+
+# Write buffer for saved reports (1 MiB)
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Filename sanitization patterns (applied to lowercased text)
+_BUG_PREFIX_RE = re.compile(r'^(?:\[bug\]\s*)?(?:bug:\s*)?')
+_HYPHEN_RUN_RE = re.compile(r'-{2,}')
+
+
 class BugReportGenerator:
     """Generate and save GitHub bug report markdown files"""
 
@@ -23,6 +46,13 @@ class BugReportGenerator:
         """
         self.output_dir = output_dir
         self.create_issue_subdir = create_issue_subdir
+        self._created_dirs = set()
+
+        # One timestamp per generator (migration batch); a sequence suffix keeps
+        # filenames unique when the same issue/summary is saved more than once
+        self._batch_timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        self._issued_filenames = set()
+        self._seq = 0
 
     def save_report(
         self,
@@ -41,28 +71,75 @@ class BugReportGenerator:
         Returns:
             Path to saved file
         """
-        # Determine output directory
-        if self.create_issue_subdir:
-            # Create subdirectory named after JIRA issue
-            issue_output_dir = os.path.join(self.output_dir, jira_issue_key)
-        else:
-            issue_output_dir = self.output_dir
+        filepath = self._prepare_filepath(jira_issue_key, issue_summary)
+        self._write_report(filepath, markdown_content)
+        return filepath
+
+    def save_many(
+        self,
+        reports: Iterable[Tuple[str, str, str]],
+        max_workers: int = 16
+    ) -> List[str]:
+        """
+        Save several bug reports, overlapping the file writes in a thread pool.
+
+        Directories and filenames are resolved up front on the calling thread;
+        only the independent file writes run in parallel.
+
+        Args:
+            reports: Iterable of (markdown_content, jira_issue_key, issue_summary)
+            max_workers: Maximum number of concurrent writer threads
+
+        Returns:
+            Paths to saved files, in input order
+        """
+        jobs = [
+            (self._prepare_filepath(jira_issue_key, issue_summary), markdown_content)
+            for markdown_content, jira_issue_key, issue_summary in reports
+        ]
+        if not jobs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            list(executor.map(self._save_one, jobs))
+
+        return [filepath for filepath, _ in jobs]
+
+    def _save_one(self, job: Tuple[str, str]):
+        """Write one (filepath, markdown_content) job from save_many"""
+        filepath, markdown_content = job
+        self._write_report(filepath, markdown_content)
+
+    def _prepare_filepath(self, jira_issue_key: str, issue_summary: str) -> str:
+        """Create the issue output directory and return the report file path"""
+        # Determine output directory (subdirectory per JIRA issue if enabled)
+        issue_output_dir = self.get_issue_output_dir(jira_issue_key)
 
         # Create output directory if it doesn't exist
-        os.makedirs(issue_output_dir, exist_ok=True)
+        self._ensure_output_dir(issue_output_dir)
 
         # Generate filename
         filename = self._generate_filename(jira_issue_key, issue_summary)
 
-        # Full file path
-        filepath = os.path.join(issue_output_dir, filename)
-
-        # Write file
-        with open(filepath, 'w', encoding='utf-8') as f:
+        return os.path.join(issue_output_dir, filename)
+
+    def _write_report(self, filepath: str, markdown_content: str):
+        """Write report markdown to disk"""
+        try:
+            self._open_and_write(filepath, markdown_content)
+        except FileNotFoundError:
+            # Directory was removed after it was first created; recreate and retry
+            directory = os.path.dirname(filepath)
+            self._created_dirs.discard(directory)
+            self._ensure_output_dir(directory)
+            self._open_and_write(filepath, markdown_content)
+
+    @staticmethod
+    def _open_and_write(filepath: str, markdown_content: str):
+        # Large buffer; newline='' skips CRLF translation on Windows
+        with open(filepath, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
             f.write(markdown_content)
 
-        return filepath
-
     def get_issue_output_dir(self, jira_issue_key: str) -> str:
         """
         Get the output directory for a specific JIRA issue.
@@ -77,6 +154,12 @@ class BugReportGenerator:
             return os.path.join(self.output_dir, jira_issue_key)
         return self.output_dir
 
+    def _ensure_output_dir(self, directory: str):
+        """Create directory once per generator; _write_report recreates it if removed"""
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+
     def _generate_filename(self, issue_key: str, summary: str) -> str:
         """
         Generate filename for the bug report.
@@ -84,6 +167,10 @@ class BugReportGenerator:
         Format: {JIRA-KEY}-{timestamp}-{sanitized-summary}.md
         Example: PROJ-123-20251104-153045-nullreferenceexception-orderprocessor.md
 
+        The timestamp is fixed per generator. If a name was already issued in
+        this batch, a sequence number is inserted before the summary:
+        PROJ-123-20251104-153045-0001-nullreferenceexception-orderprocessor.md
+
         Args:
             issue_key: JIRA issue key
             summary: Issue summary
@@ -91,8 +178,6 @@ class BugReportGenerator:
         Returns:
             Filename string
         """
-        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
-
         # Sanitize summary for filename
         safe_summary = self._sanitize_for_filename(summary)
 
@@ -101,7 +186,12 @@ class BugReportGenerator:
         if len(safe_summary) > max_summary_length:
             safe_summary = safe_summary[:max_summary_length]
 
-        filename = f"{issue_key}-{timestamp}-{safe_summary}.md"
+        prefix = f"{issue_key}-{self._batch_timestamp}"
+        filename = f"{prefix}-{safe_summary}.md"
+        while filename in self._issued_filenames:
+            self._seq += 1
+            filename = f"{prefix}-{self._seq:04d}-{safe_summary}.md"
+        self._issued_filenames.add(filename)
 
         return filename
 
@@ -115,23 +205,14 @@ class BugReportGenerator:
         Returns:
             Safe filename component (lowercase, alphanumeric and hyphens)
         """
-        # Convert to lowercase
-        text = text.lower()
-
-        # Remove common prefixes
-        text = re.sub(r'^\[bug\]\s*', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'^bug:\s*', '', text, flags=re.IGNORECASE)
+        # Convert to lowercase and remove common "[bug]" / "bug:" prefixes
+        text = _BUG_PREFIX_RE.sub('', text.lower(), count=1)
 
-        # Replace non-alphanumeric characters with hyphens
-        text = re.sub(r'[^a-z0-9]+', '-', text)
+        # Replace non-alphanumeric characters with hyphens, then collapse runs
+        text = _HYPHEN_RUN_RE.sub('-', text.translate(_FILENAME_TABLE))
 
         # Remove leading/trailing hyphens
-        text = text.strip('-')
-
-        # Collapse multiple hyphens into one
-        text = re.sub(r'-+', '-', text)
-
-        return text
+        return text.strip('-')
 
 
 def save_github_bug_report(
@@ -181,6 +262,35 @@ def save_github_bug_report(
     return generator.save_report(markdown_content, jira_issue_key, issue_summary)
 
 
+def save_github_bug_reports(
+    reports: Iterable[Tuple[str, str, str]],
+    output_dir: str = "migrated-bugs",
+    max_workers: int = 16
+) -> List[str]:
+    """
+    Convenience function to save many GitHub bug reports in one batch.
+
+    Usage:
+        from report_generator import save_github_bug_reports
+
+        filepaths = save_github_bug_reports(
+            [(markdown, jira_data['issue_key'], jira_data['summary'])
+             for jira_data, markdown in migrated],
+            output_dir="migrated-bugs"
+        )
+
+    Args:
+        reports: Iterable of (markdown_content, jira_issue_key, issue_summary)
+        output_dir: Output directory (defaults to "migrated-bugs")
+        max_workers: Maximum number of concurrent writer threads
+
+    Returns:
+        Paths to saved files, in input order
+    """
+    generator = BugReportGenerator(output_dir=output_dir)
+    return generator.save_many(reports, max_workers=max_workers)
+
+
 def generate_and_save_report(
     jira_data: Dict[str, Any],
     validation_result: Dict[str, Any],
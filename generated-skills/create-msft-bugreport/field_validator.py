@@ -5,9 +5,26 @@ Validates JIRA issue data against GitHub bug template requirements.
 Identifies missing required and recommended fields.
 """
 
+import re
 from typing import Dict, List, Any
 
 
+# OS names detected with a plain substring test on the lowercased text
+_OS_KEYWORDS = ('windows', 'linux', 'macos', 'ubuntu')
+
+# Fallback for an "OS: <value>" label and the bare word "mac"
+_OS_LABEL_RE = re.compile(r'(?:os|operating system)[:\s]*\w|\bmac\b', re.IGNORECASE)
+
+# Workaround mentions in comment bodies
+_WORKAROUND_RE = re.compile(r'workaround', re.IGNORECASE)
+
+# .NET version indicators
+_DOTNET_RE = re.compile(
+    r'\.net\s+[\d.]+|(?:framework|core|runtime)\s+[\d.]+',
+    re.IGNORECASE
+)
+
+
 class GitHubFieldValidator:
     """Validate fields against GitHub bug template requirements"""
 
@@ -30,12 +47,33 @@ class GitHubFieldValidator:
         'Root Cause'
     ]
 
+    # Denominator for the completeness score
+    TOTAL_FIELDS = len(REQUIRED_FIELDS) + len(RECOMMENDED_FIELDS)
+
     # Environment sub-fields
     ENVIRONMENT_SUBFIELDS = [
         'OS',
         '.NET Version'
     ]
 
+    # Required field -> parsed JIRA key, in report order
+    REQUIRED_FIELD_KEYS = (
+        ('Title', 'summary'),
+        ('Description', 'description'),
+        ('Steps to Reproduce', 'steps_to_reproduce'),
+        ('Expected Behavior', 'expected_behavior'),
+        ('Actual Behavior', 'actual_behavior'),
+        ('Environment', 'environment'),
+        ('Severity', 'priority'),
+    )
+
+    # Recommended field -> parsed JIRA key (Workaround is checked separately)
+    RECOMMENDED_FIELD_KEYS = (
+        ('Related Issues', 'links'),
+        ('Screenshots', 'attachments'),
+        ('Root Cause', 'root_cause'),
+    )
+
     def __init__(self, jira_data: Dict[str, Any]):
         """
         Initialize validator with JIRA data.
@@ -47,11 +85,16 @@ class GitHubFieldValidator:
         self.missing_required = []
         self.missing_recommended = []
         self.present_fields = []
+        self._result = None
 
     def validate(self) -> Dict[str, Any]:
         """
         Validate all fields and return results.
 
+        The result is cached on the validator, so repeated calls (e.g. for a
+        summary after the dict) do not rescan the fields. Create a new
+        validator if the JIRA data changes.
+
         Returns:
             Dictionary with:
             - missing_required: List of missing required fields
@@ -60,6 +103,9 @@ class GitHubFieldValidator:
             - is_complete: Boolean indicating if all required fields present
             - completeness_score: Percentage of all fields present
         """
+        if self._result is not None:
+            return self._result
+
         self.missing_required = []
         self.missing_recommended = []
         self.present_fields = []
@@ -71,11 +117,10 @@ class GitHubFieldValidator:
         self._validate_recommended_fields()
 
         # Calculate completeness
-        total_fields = len(self.REQUIRED_FIELDS) + len(self.RECOMMENDED_FIELDS)
         present_count = len(self.present_fields)
-        completeness = (present_count / total_fields) * 100
+        completeness = (present_count / self.TOTAL_FIELDS) * 100
 
-        return {
+        self._result = {
             'missing_required': self.missing_required,
             'missing_recommended': self.missing_recommended,
             'present_fields': self.present_fields,
@@ -84,88 +129,45 @@ class GitHubFieldValidator:
             'total_required': len(self.REQUIRED_FIELDS),
             'total_recommended': len(self.RECOMMENDED_FIELDS)
         }
+        return self._result
 
     def _validate_required_fields(self):
         """Validate required fields"""
-        # Title (from Summary)
-        if self._is_field_present(self.jira.get('summary', '')):
-            self.present_fields.append('Title')
-        else:
-            self.missing_required.append('Title')
-
-        # Description
-        if self._is_field_present(self.jira.get('description', '')):
-            self.present_fields.append('Description')
-        else:
-            self.missing_required.append('Description')
-
-        # Steps to Reproduce
-        if self._is_field_present(self.jira.get('steps_to_reproduce', '')):
-            self.present_fields.append('Steps to Reproduce')
-        else:
-            self.missing_required.append('Steps to Reproduce')
-
-        # Expected Behavior
-        if self._is_field_present(self.jira.get('expected_behavior', '')):
-            self.present_fields.append('Expected Behavior')
-        else:
-            self.missing_required.append('Expected Behavior')
-
-        # Actual Behavior
-        if self._is_field_present(self.jira.get('actual_behavior', '')):
-            self.present_fields.append('Actual Behavior')
-        else:
-            self.missing_required.append('Actual Behavior')
-
-        # Environment (overall)
-        env_text = self.jira.get('environment', '')
-        if self._is_field_present(env_text):
-            self.present_fields.append('Environment')
-        else:
-            self.missing_required.append('Environment')
-
-        # Environment sub-fields
-        if not self._has_os_info(env_text):
-            self.missing_required.append('OS')
-        else:
-            self.present_fields.append('OS')
-
-        if not self._has_dotnet_version(env_text):
-            self.missing_required.append('.NET Version')
-        else:
-            self.present_fields.append('.NET Version')
-
-        # Severity (from Priority)
-        if self._is_field_present(self.jira.get('priority', '')):
-            self.present_fields.append('Severity')
-        else:
-            self.missing_required.append('Severity')
+        for label, key in self.REQUIRED_FIELD_KEYS:
+            value = self.jira.get(key, '')
+            if self._is_field_present(value):
+                self.present_fields.append(label)
+            else:
+                self.missing_required.append(label)
+
+            # Environment sub-fields follow the overall Environment check
+            if key == 'environment':
+                self._validate_environment_subfields(value)
+
+    def _validate_environment_subfields(self, env_text: str):
+        """Validate OS and .NET version inside the environment text"""
+        checks = (
+            ('OS', self._has_os_info(env_text)),
+            ('.NET Version', self._has_dotnet_version(env_text)),
+        )
+        for label, present in checks:
+            if present:
+                self.present_fields.append(label)
+            else:
+                self.missing_required.append(label)
 
     def _validate_recommended_fields(self):
         """Validate recommended fields"""
-        # Workaround
         if self._has_workaround():
             self.present_fields.append('Workaround')
         else:
             self.missing_recommended.append('Workaround')
 
-        # Related Issues
-        if self.jira.get('links'):
-            self.present_fields.append('Related Issues')
-        else:
-            self.missing_recommended.append('Related Issues')
-
-        # Screenshots
-        if self.jira.get('attachments'):
-            self.present_fields.append('Screenshots')
-        else:
-            self.missing_recommended.append('Screenshots')
-
-        # Root Cause
-        if self._is_field_present(self.jira.get('root_cause', '')):
-            self.present_fields.append('Root Cause')
-        else:
-            self.missing_recommended.append('Root Cause')
+        for label, key in self.RECOMMENDED_FIELD_KEYS:
+            if self._is_field_present(self.jira.get(key)):
+                self.present_fields.append(label)
+            else:
+                self.missing_recommended.append(label)
 
     def _is_field_present(self, value: Any) -> bool:
         """Check if field has meaningful content"""
@@ -173,10 +175,13 @@ class GitHubFieldValidator:
             return False
 
         if isinstance(value, str):
-            # Strip whitespace and check length
-            cleaned = value.strip()
-            # Consider field present if it has at least 3 characters
-            return len(cleaned) >= 3
+            # Consider field present if it has at least 3 non-surrounding-whitespace
+            # characters; only strip() (and allocate) when there is whitespace to strip
+            if len(value) < 3:
+                return False
+            if not value[0].isspace() and not value[-1].isspace():
+                return True
+            return len(value.strip()) >= 3
 
         if isinstance(value, (list, dict)):
             return len(value) > 0
@@ -188,42 +193,18 @@ class GitHubFieldValidator:
         if not env_text:
             return False
 
-        import re
-        # Look for OS indicators
-        os_patterns = [
-            r'(?:os|operating system)[:\s]*(\w+)',
-            r'\bwindows\b',
-            r'\blinux\b',
-            r'\bmac\b',
-            r'\bmacos\b',
-            r'\bubuntu\b'
-        ]
-
-        for pattern in os_patterns:
-            if re.search(pattern, env_text, re.IGNORECASE):
-                return True
+        lowered = env_text.lower()
+        if any(keyword in lowered for keyword in _OS_KEYWORDS):
+            return True
 
-        return False
+        return _OS_LABEL_RE.search(env_text) is not None
 
     def _has_dotnet_version(self, env_text: str) -> bool:
         """Check if environment text contains .NET version"""
         if not env_text:
             return False
 
-        import re
-        # Look for .NET version indicators
-        dotnet_patterns = [
-            r'\.net\s+[\d\.]+',
-            r'framework\s+[\d\.]+',
-            r'core\s+[\d\.]+',
-            r'runtime\s+[\d\.]+'
-        ]
-
-        for pattern in dotnet_patterns:
-            if re.search(pattern, env_text, re.IGNORECASE):
-                return True
-
-        return False
+        return _DOTNET_RE.search(env_text) is not None
 
     def _has_workaround(self) -> bool:
         """Check if workaround is documented"""
@@ -231,34 +212,36 @@ class GitHubFieldValidator:
         if self._is_field_present(self.jira.get('root_cause', '')):
             return True
 
-        # Check comments for workaround
-        comments = self.jira.get('comments', [])
-        for comment in comments:
-            body = comment.get('body', '').lower()
-            if 'workaround' in body:
-                return True
-
-        return False
+        # Check comments for workaround (case-insensitive, no lowercased copies)
+        return any(
+            _WORKAROUND_RE.search(comment.get('body', '') or '')
+            for comment in self.jira.get('comments', [])
+        )
 
     def generate_summary(self) -> str:
         """Generate human-readable validation summary"""
-        lines = []
+        return _format_summary(self.missing_required, self.missing_recommended)
 
-        if not self.missing_required:
-            lines.append("✓ All required fields present")
-        else:
-            lines.append(f"⚠️ {len(self.missing_required)} required fields missing:")
-            for field in self.missing_required:
-                lines.append(f"  - {field}")
 
-        if not self.missing_recommended:
-            lines.append("✓ All recommended fields present")
-        else:
-            lines.append(f"  {len(self.missing_recommended)} recommended fields missing:")
-            for field in self.missing_recommended:
-                lines.append(f"  - {field}")
+def _format_summary(missing_required: List[str], missing_recommended: List[str]) -> str:
+    """Format missing required/recommended fields as a human-readable summary"""
+    lines = []
+
+    if not missing_required:
+        lines.append("✓ All required fields present")
+    else:
+        lines.append(f"⚠️ {len(missing_required)} required fields missing:")
+        for field in missing_required:
+            lines.append(f"  - {field}")
 
-        return '\n'.join(lines)
+    if not missing_recommended:
+        lines.append("✓ All recommended fields present")
+    else:
+        lines.append(f"  {len(missing_recommended)} recommended fields missing:")
+        for field in missing_recommended:
+            lines.append(f"  - {field}")
+
+    return '\n'.join(lines)
 
 
 def validate_fields(jira_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -300,6 +283,23 @@ def get_validation_summary(jira_data: Dict[str, Any]) -> str:
     return validator.generate_summary()
 
 
+def format_validation_summary(validation: Dict[str, Any]) -> str:
+    """
+    Format an existing validation result without validating again.
+
+    Usage:
+        validation = validate_fields(jira_data)
+        summary = format_validation_summary(validation)
+
+    Args:
+        validation: Result of validate() or validate_fields()
+
+    Returns:
+        Human-readable summary string
+    """
+    return _format_summary(validation['missing_required'], validation['missing_recommended'])
+
+
 if __name__ == '__main__':
     # Example usage
     sample_jira_data = {
@@ -0,0 +1,70 @@
+"""
+Shared Bug Behavior Helpers
+
+Expected/actual behavior text and exception blocks used by both the JIRA
+formatter and the Markdown report generator.
+"""
+
+from typing import Dict
+
+
+EXPECTED_BEHAVIORS = {
+    'NullReferenceException':
+        "The method should handle null inputs gracefully or validate parameters before use.",
+    'InvalidOperationException':
+        "The operation should complete without modifying collections during enumeration.",
+    'DivideByZeroException':
+        "Division operations should check for zero divisor and handle appropriately.",
+    'IndexOutOfRangeException':
+        "Array/list access should validate index bounds before accessing elements.",
+}
+
+DEFAULT_EXPECTED_BEHAVIOR = "The code should execute without throwing an exception."
+
+
+def expected_behavior(exception_type: str) -> str:
+    """Generate expected behavior description for an exception type"""
+    return EXPECTED_BEHAVIORS.get(exception_type, DEFAULT_EXPECTED_BEHAVIOR)
+
+
+def actual_behavior(exception_type: str, message: str, inline_code: bool = False) -> str:
+    """
+    Generate actual behavior description.
+
+    Args:
+        exception_type: Exception type name
+        message: Exception message
+        inline_code: Wrap the exception type in Markdown backticks
+
+    Returns:
+        Actual behavior sentence
+    """
+    if inline_code:
+        exception_type = f"`{exception_type}`"
+    return f"The code throws {exception_type}: {message}"
+
+
+def format_stacktrace_block(bug_data: Dict, fence_open: str, fence_close: str) -> str:
+    """
+    Build a fenced exception block from bug analysis data.
+
+    Args:
+        bug_data: Bug analysis data from bug_analyzer.py
+        fence_open: Opening fence (e.g., "{code:csharp}" or "```csharp")
+        fence_close: Closing fence (e.g., "{code}" or "```")
+
+    Returns:
+        Fence, exception line, optional location line and closing fence
+    """
+    lines = [
+        fence_open,
+        f"{bug_data['exception_type']}: {bug_data.get('message', 'No message')}",
+    ]
+    fp = bug_data.get('file_path')
+    if fp:
+        location = f"   at {bug_data.get('class_name', '')}.{bug_data.get('method', '')} in {fp}"
+        if bug_data.get('line_number'):
+            location += f":line {bug_data['line_number']}"
+        lines.append(location)
+    lines.append(fence_close)
+    return '\n'.join(lines)
@@ -8,6 +8,25 @@ Claude will use this to prepare data before calling Atlassian MCP tools.
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from _behaviors import actual_behavior, expected_behavior, format_stacktrace_block
+
+
+# JIRA wiki markup fragments reused across every description
+_CODE_OPEN_CS = "{code:csharp}"
+_CODE_CLOSE = "{code}"
+_COMMENT_CODE_OPEN = "\n" + _CODE_OPEN_CS
+_H2_ENVIRONMENT = "h2. Environment"
+_H2_DESCRIPTION = "\nh2. Description"
+_H2_STEPS = "\nh2. Steps to Reproduce"
+_H2_EXPECTED = "\nh2. Expected Behavior"
+_H2_ACTUAL = "\nh2. Actual Behavior"
+_H2_EXCEPTION = "\nh2. Exception Details"
+_H2_ROOT_CAUSE = "\nh2. Root Cause Analysis"
+_H2_SUGGESTED_FIX = "\nh2. Suggested Fix"
+_H2_IMPACT = "\nh2. Impact"
+_RULE = "\n----"
+_FOOTER = "_Automated bug report generated by Claude Code (C# Bug Documentation Skill)_"
+
 
 class JiraFormatter:
     """Formats bug data for JIRA issues"""
@@ -93,24 +112,25 @@ class JiraFormatter:
     ) -> str:
         """Create JIRA wiki markup description"""
         sections = []
+        fp = bug_data.get('file_path')
+        ln = bug_data.get('line_number')
+        ns = bug_data.get('namespace')
 
         # Header
-        sections.append("h2. Environment")
+        sections.append(_H2_ENVIRONMENT)
         env_items = [
             f"* Language: C#",
             f"* Component: {bug_data.get('component', 'Unknown')}",
         ]
-        if bug_data.get('file_path'):
-            env_items.append(f"* File: {bug_data['file_path']}")
-            if bug_data.get('line_number'):
-                env_items[-1] += f":{bug_data['line_number']}"
-        if bug_data.get('namespace'):
-            env_items.append(f"* Namespace: {bug_data['namespace']}")
+        if fp:
+            env_items.append(f"* File: {fp}:{ln}" if ln else f"* File: {fp}")
+        if ns:
+            env_items.append(f"* Namespace: {ns}")
         env_items.append(f"* Reported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         sections.append('\n'.join(env_items))
 
         # Description
-        sections.append("\nh2. Description")
+        sections.append(_H2_DESCRIPTION)
         if bug_data.get('message'):
             sections.append(f"{bug_data['exception_type']}: {bug_data['message']}")
         else:
@@ -121,79 +141,54 @@ class JiraFormatter:
 
         # Steps to Reproduce
         if reproduction_steps:
-            sections.append("\nh2. Steps to Reproduce")
-            for i, step in enumerate(reproduction_steps, 1):
-                sections.append(f"# {step}")
+            sections.append(_H2_STEPS)
+            sections.append('\n'.join(f"# {step}" for step in reproduction_steps))
 
         # Expected vs Actual Behavior
-        sections.append("\nh2. Expected Behavior")
+        sections.append(_H2_EXPECTED)
         sections.append(self._get_expected_behavior(bug_data))
 
-        sections.append("\nh2. Actual Behavior")
+        sections.append(_H2_ACTUAL)
         sections.append(self._get_actual_behavior(bug_data))
 
         # Stacktrace (if available in original data)
         if bug_data.get('exception_type'):
-            sections.append("\nh2. Exception Details")
-            sections.append("{code:csharp}")
-            stacktrace_lines = [
-                f"{bug_data['exception_type']}: {bug_data.get('message', 'No message')}"
-            ]
-            if bug_data.get('file_path'):
-                location = f"   at {bug_data.get('class_name', '')}.{bug_data.get('method', '')}"
-                if bug_data.get('file_path'):
-                    location += f" in {bug_data['file_path']}"
-                    if bug_data.get('line_number'):
-                        location += f":line {bug_data['line_number']}"
-                stacktrace_lines.append(location)
-            sections.append('\n'.join(stacktrace_lines))
-            sections.append("{code}")
+            sections.append(_H2_EXCEPTION)
+            sections.append(format_stacktrace_block(bug_data, _CODE_OPEN_CS, _CODE_CLOSE))
 
         # Root Cause Analysis
         if bug_data.get('root_cause'):
-            sections.append("\nh2. Root Cause Analysis")
+            sections.append(_H2_ROOT_CAUSE)
             sections.append(bug_data['root_cause'])
 
         # Suggested Fix
         if suggested_fix:
-            sections.append("\nh2. Suggested Fix")
-            sections.append("{code:csharp}")
+            sections.append(_H2_SUGGESTED_FIX)
+            sections.append(_CODE_OPEN_CS)
             sections.append(suggested_fix)
-            sections.append("{code}")
+            sections.append(_CODE_CLOSE)
 
         # Impact
         if impact:
-            sections.append("\nh2. Impact")
-            for item in impact:
-                sections.append(f"* {item}")
+            sections.append(_H2_IMPACT)
+            sections.append('\n'.join(f"* {item}" for item in impact))
 
         # Footer
-        sections.append("\n----")
-        sections.append("_Automated bug report generated by Claude Code (C# Bug Documentation Skill)_")
+        sections.append(_RULE)
+        sections.append(_FOOTER)
 
         return '\n'.join(sections)
 
     def _get_expected_behavior(self, bug_data: Dict) -> str:
         """Generate expected behavior description"""
-        exception_type = bug_data.get('exception_type', '')
-
-        if exception_type == 'NullReferenceException':
-            return "The method should handle null inputs gracefully or validate parameters before use."
-        elif exception_type == 'InvalidOperationException':
-            return "The operation should complete without modifying collections during enumeration."
-        elif exception_type == 'DivideByZeroException':
-            return "Division operations should check for zero divisor and handle appropriately."
-        elif exception_type == 'IndexOutOfRangeException':
-            return "Array/list access should validate index bounds before accessing elements."
-        else:
-            return "The code should execute without throwing an exception."
+        return expected_behavior(bug_data.get('exception_type', ''))
 
     def _get_actual_behavior(self, bug_data: Dict) -> str:
         """Generate actual behavior description"""
-        exception_type = bug_data.get('exception_type', 'exception')
-        message = bug_data.get('message', 'An error occurred')
-
-        return f"The code throws {exception_type}: {message}"
+        return actual_behavior(
+            bug_data.get('exception_type', 'exception'),
+            bug_data.get('message', 'An error occurred')
+        )
 
     def format_comment(self, comment_text: str, code_snippet: Optional[str] = None) -> str:
         """
@@ -209,9 +204,9 @@ class JiraFormatter:
         parts = [comment_text]
 
         if code_snippet:
-            parts.append("\n{code:csharp}")
+            parts.append(_COMMENT_CODE_OPEN)
             parts.append(code_snippet)
-            parts.append("{code}")
+            parts.append(_CODE_CLOSE)
 
         return '\n'.join(parts)
 
@@ -300,7 +295,7 @@ def format_stacktrace_for_jira(stacktrace: str) -> str:
     Returns:
         JIRA wiki markup with code block
     """
-    return f"{{code:csharp}}\n{stacktrace}\n{{code}}"
+    return f"{_CODE_OPEN_CS}\n{stacktrace}\n{_CODE_CLOSE}"
 
 
 def create_jira_comment_with_fix(fix_description: str, code: str) -> str:
@@ -4,11 +4,23 @@ Markdown Report Generator
 Generates Microsoft-style bug reports in Markdown format.
 """
 
+import io
 import os
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TextIO
 from datetime import datetime
 
+from _behaviors import actual_behavior, expected_behavior, format_stacktrace_block
+
+
+# Write buffer for streamed reports (64 KiB)
+WRITE_BUFFER_SIZE = 1 << 16
+
+# Markdown code fences reused across every report
+_MD_CODE_OPEN = "```csharp\n"
+_MD_CODE_OPEN_EXCEPTION = "\n```csharp"
+_MD_CODE_CLOSE = "```\n\n"
+
 
 class MarkdownReportGenerator:
     """Generates Markdown bug reports"""
@@ -25,8 +37,7 @@ class MarkdownReportGenerator:
 
     def _ensure_output_dir(self):
         """Create output directory if it doesn't exist"""
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        os.makedirs(self.output_dir, exist_ok=True)
 
     def generate_report(
         self,
@@ -40,6 +51,9 @@ class MarkdownReportGenerator:
         """
         Generate Markdown bug report.
 
+        The report is streamed straight to disk, so only one section is held
+        in memory at a time.
+
         Args:
             bug_data: Bug analysis data from bug_analyzer.py
             reproduction_steps: List of reproduction steps
@@ -51,20 +65,19 @@ class MarkdownReportGenerator:
         Returns:
             Path to generated Markdown file
         """
-        content = self._create_markdown_content(
-            bug_data,
-            reproduction_steps,
-            suggested_fix,
-            impact,
-            jira_issue_key,
-            jira_url
-        )
-
         filename = self._generate_filename(bug_data, jira_issue_key)
         filepath = os.path.join(self.output_dir, filename)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        with open(filepath, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            self._write_markdown_content(
+                f,
+                bug_data,
+                reproduction_steps,
+                suggested_fix,
+                impact,
+                jira_issue_key,
+                jira_url
+            )
 
         return filepath
 
@@ -77,27 +90,48 @@ class MarkdownReportGenerator:
         jira_issue_key: Optional[str],
         jira_url: Optional[str]
     ) -> str:
-        """Create Markdown content for the bug report"""
-        sections = []
+        """Create Markdown content for the bug report as a string"""
+        buffer = io.StringIO()
+        self._write_markdown_content(
+            buffer,
+            bug_data,
+            reproduction_steps,
+            suggested_fix,
+            impact,
+            jira_issue_key,
+            jira_url
+        )
+        return buffer.getvalue()
 
+    def _write_markdown_content(
+        self,
+        f: TextIO,
+        bug_data: Dict,
+        reproduction_steps: List[str],
+        suggested_fix: Optional[str],
+        impact: Optional[List[str]],
+        jira_issue_key: Optional[str],
+        jira_url: Optional[str]
+    ) -> None:
+        """Write Markdown content for the bug report to an open text stream"""
         # Title
         title = self._create_title(bug_data)
-        sections.append(f"# Bug Report: {title}\n")
+        f.write(f"# Bug Report: {title}\n\n")
 
         # JIRA link (if available)
         if jira_issue_key and jira_url:
-            sections.append(f"**JIRA Issue**: [{jira_issue_key}]({jira_url})\n")
+            f.write(f"**JIRA Issue**: [{jira_issue_key}]({jira_url})\n\n")
         elif jira_issue_key:
-            sections.append(f"**JIRA Issue**: {jira_issue_key}\n")
+            f.write(f"**JIRA Issue**: {jira_issue_key}\n\n")
 
         # Severity
-        sections.append("## Severity")
+        f.write("## Severity\n")
         severity = bug_data.get('severity', 'Medium')
         severity_desc = self._get_severity_description(severity)
-        sections.append(f"**{severity}** - {severity_desc}\n")
+        f.write(f"**{severity}** - {severity_desc}\n\n")
 
         # Environment
-        sections.append("## Environment")
+        f.write("## Environment\n")
         env_items = [
             f"- **Language**: C#",
             f"- **Component**: {bug_data.get('component', 'Unknown')}",
@@ -106,86 +140,71 @@ class MarkdownReportGenerator:
             env_items.append(f"- **Class**: {bug_data['class_name']}")
         if bug_data.get('method'):
             env_items.append(f"- **Method**: {bug_data['method']}")
-        if bug_data.get('file_path'):
-            file_location = bug_data['file_path']
-            if bug_data.get('line_number'):
-                file_location += f":{bug_data['line_number']}"
-            env_items.append(f"- **File**: `{file_location}`")
+        fp = bug_data.get('file_path')
+        ln = bug_data.get('line_number')
+        if fp:
+            env_items.append(f"- **File**: `{fp}:{ln}`" if ln else f"- **File**: `{fp}`")
         if bug_data.get('namespace'):
             env_items.append(f"- **Namespace**: {bug_data['namespace']}")
         env_items.append(f"- **Reported**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        sections.append('\n'.join(env_items) + '\n')
+        for item in env_items:
+            f.write(item + '\n')
+        f.write('\n')
 
         # Description
-        sections.append("## Description")
+        f.write("## Description\n")
         if bug_data.get('message'):
-            sections.append(f"{bug_data.get('exception_type', 'Exception')}: {bug_data['message']}\n")
+            f.write(f"{bug_data.get('exception_type', 'Exception')}: {bug_data['message']}\n\n")
         else:
-            sections.append(f"A {bug_data.get('exception_type', 'bug')} has been detected.\n")
+            f.write(f"A {bug_data.get('exception_type', 'bug')} has been detected.\n\n")
 
         if bug_data.get('user_description'):
-            sections.append(bug_data['user_description'] + '\n')
+            f.write(bug_data['user_description'] + '\n\n')
 
         # Steps to Reproduce
         if reproduction_steps:
-            sections.append("## Steps to Reproduce")
-            for i, step in enumerate(reproduction_steps, 1):
-                sections.append(f"{i}. {step}")
-            sections.append("")
+            f.write("## Steps to Reproduce\n")
+            f.write(''.join(
+                f"{i}. {step}\n" for i, step in enumerate(reproduction_steps, 1)
+            ) + '\n')
 
         # Expected Behavior
-        sections.append("## Expected Behavior")
-        sections.append(self._get_expected_behavior(bug_data) + '\n')
+        f.write("## Expected Behavior\n")
+        f.write(self._get_expected_behavior(bug_data) + '\n\n')
 
         # Actual Behavior
-        sections.append("## Actual Behavior")
-        sections.append(self._get_actual_behavior(bug_data))
+        f.write("## Actual Behavior\n")
+        f.write(self._get_actual_behavior(bug_data) + '\n')
 
         # Exception details (if available)
         if bug_data.get('exception_type'):
-            sections.append("\n```csharp")
-            stacktrace_lines = [
-                f"{bug_data['exception_type']}: {bug_data.get('message', 'No message')}"
-            ]
-            if bug_data.get('file_path'):
-                location = f"   at {bug_data.get('class_name', '')}.{bug_data.get('method', '')}"
-                if bug_data.get('file_path'):
-                    location += f" in {bug_data['file_path']}"
-                    if bug_data.get('line_number'):
-                        location += f":line {bug_data['line_number']}"
-                stacktrace_lines.append(location)
-            sections.append('\n'.join(stacktrace_lines))
-            sections.append("```\n")
+            f.write(format_stacktrace_block(bug_data, _MD_CODE_OPEN_EXCEPTION, _MD_CODE_CLOSE))
 
         # Root Cause
         if bug_data.get('root_cause'):
-            sections.append("## Root Cause")
-            sections.append(bug_data['root_cause'] + '\n')
+            f.write("## Root Cause\n")
+            f.write(bug_data['root_cause'] + '\n\n')
 
         # Suggested Fix
         if suggested_fix:
-            sections.append("## Suggested Fix")
-            sections.append("```csharp")
-            sections.append(suggested_fix)
-            sections.append("```\n")
+            f.write("## Suggested Fix\n")
+            f.write(_MD_CODE_OPEN)
+            f.write(suggested_fix + '\n')
+            f.write(_MD_CODE_CLOSE)
 
         # Impact
         if impact:
-            sections.append("## Impact")
-            for item in impact:
-                sections.append(f"- {item}")
-            sections.append("")
+            f.write("## Impact\n")
+            f.write(''.join(f"- {item}\n" for item in impact) + '\n')
 
         # Footer
-        sections.append("---")
+        f.write("---\n")
         footer_items = []
         if jira_issue_key:
             footer_items.append(f"**JIRA**: {jira_issue_key}")
         footer_items.append(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         footer_items.append("**Reporter**: Claude (C# Bug Documentation Skill)")
-        sections.append("  \n".join(footer_items))
-
-        return '\n'.join(sections)
+        f.write("  \n".join(footer_items))
 
     def _create_title(self, bug_data: Dict) -> str:
         """Create report title"""
@@ -227,25 +246,15 @@ class MarkdownReportGenerator:
 
     def _get_expected_behavior(self, bug_data: Dict) -> str:
         """Generate expected behavior description"""
-        exception_type = bug_data.get('exception_type', '')
-
-        if exception_type == 'NullReferenceException':
-            return "The method should handle null inputs gracefully or validate parameters before use."
-        elif exception_type == 'InvalidOperationException':
-            return "The operation should complete without modifying collections during enumeration."
-        elif exception_type == 'DivideByZeroException':
-            return "Division operations should check for zero divisor and handle appropriately."
-        elif exception_type == 'IndexOutOfRangeException':
-            return "Array/list access should validate index bounds before accessing elements."
-        else:
-            return "The code should execute without throwing an exception."
+        return expected_behavior(bug_data.get('exception_type', ''))
 
     def _get_actual_behavior(self, bug_data: Dict) -> str:
         """Generate actual behavior description"""
-        exception_type = bug_data.get('exception_type', 'exception')
-        message = bug_data.get('message', 'An error occurred')
-
-        return f"The code throws `{exception_type}`: {message}"
+        return actual_behavior(
+            bug_data.get('exception_type', 'exception'),
+            bug_data.get('message', 'An error occurred'),
+            inline_code=True
+        )
 
 
 def generate_bug_report(
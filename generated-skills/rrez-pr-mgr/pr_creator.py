@@ -4,123 +4,444 @@ PR Creator for Azure DevOps
 Generates PR descriptions, suggests reviewers, and creates pull requests.
 """
 
+import fnmatch
+import hashlib
+import json
 import re
-from typing import Dict, List, Optional, Set
-from datetime import datetime
-from collections import defaultdict
+import subprocess
+import sys
+import threading
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Pattern, Set, Tuple, Union
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
+
+
+# Conventional commit prefix -> change type reported in the analysis
+CHANGE_TYPES = {
+    'feat': 'feature',
+    'fix': 'fix',
+    'docs': 'docs',
+    'refactor': 'refactor',
+    'test': 'test',
+}
+
+# Primary change type -> summary opening and title prefix
+_SUMMARY_OPENINGS = {
+    'feature': "This PR adds new features",
+    'fix': "This PR fixes bugs",
+    'refactor': "This PR refactors code",
+    'docs': "This PR updates documentation",
+}
+_TITLE_PREFIXES = {
+    'feature': "feat:",
+    'fix': "fix:",
+    'refactor': "refactor:",
+    'docs': "docs:",
+}
+
+# Static sections of the default PR description
+_TESTING_CHECKLIST = (
+    "## Testing\n",
+    "- [ ] Unit tests added/updated",
+    "- [ ] Integration tests pass",
+    "- [ ] Manual testing completed",
+    "- [ ] No breaking changes (or documented if present)",
+    "",
+)
+_DESCRIPTION_FOOTER = (
+    "---",
+    "*Generated by Claude Code (Azure DevOps PR Manager)*",
+)
+
+# Rendered descriptions, keyed by a digest of (commits, diff, template)
+DESCRIPTION_CACHE_SIZE = 128
+_description_cache = OrderedDict()
+_description_cache_lock = threading.Lock()
+
+# Changed file paths kept when rendering a description (only 10 are listed);
+# larger PRs are only counted. Public analyses keep every path.
+_MAX_TRACKED_FILES = 500
+
+# Conventional commit type prefix (feat, fix, docs, refactor, test) at the
+# start of the subject line; used with .match()
+_TYPE_RE = re.compile(r'(feat|fix|docs|refactor|test)(?:\([\w-]+\))?:', re.IGNORECASE)
+
+# Work item references: #1234, AB#1234, "fixes #1234"
+_WORK_ITEM_RE = re.compile(
+    r'(?:AB|(?:fix(?:es)?|close[sd]?|resolve[sd]?)\s+)?#(\d+)', re.IGNORECASE
+)
+
+# Unified diff lines of interest, one alternative per line kind:
+#   diff --git a/file.py b/file.py   -> file
+#   +added line (not the +++ header) -> add
+#   -removed line (not the --- header) -> del
+_DIFF_RE = re.compile(
+    r'^(?:diff --git a/.* b/(?P<file>.+?)[ \t\r]*$|(?P<add>\+)(?!\+\+)|(?P<del>-)(?!--))',
+    re.MULTILINE
+)
+
+# Same pattern for diffs read from git as bytes; every marker is ASCII
+_DIFF_BYTES_RE = re.compile(_DIFF_RE.pattern.encode('ascii'), re.MULTILINE)
+
+# Line markers for streamed diffs, by line type:
+# (add, del, 'd', add header, del header, file header, file header regex)
+_STREAM_MARKERS = {
+    str: ('+', '-', 'd', '+++', '---', 'diff --git', _DIFF_RE),
+    bytes: (b'+', b'-', b'd', b'+++', b'---', b'diff --git', _DIFF_BYTES_RE),
+}
+
+# A diff as text or bytes, whole or as an iterable of lines
+DiffInput = Union[str, bytes, Iterable[str], Iterable[bytes]]
+
+
+def _description_key(
+    renderer: type,
+    commits: List[Dict],
+    diff: Union[str, bytes, None],
+    template: Optional[str]
+) -> bytes:
+    """Digest identifying a generate_description call"""
+    digest = hashlib.blake2b(digest_size=16)
+    # The rendering class is part of the key, so a subclass overriding the
+    # summary or template steps never gets another class's Markdown back
+    renderer_name = f"{renderer.__module__}.{renderer.__qualname__}"
+    digest.update(json.dumps(
+        [renderer_name, commits, template], sort_keys=True, default=str
+    ).encode())
+
+    # The diff is hashed directly rather than serialized; the tag keeps str
+    # and bytes diffs apart (JSON output never contains a NUL byte)
+    if diff is None:
+        digest.update(b'\0none')
+    elif isinstance(diff, bytes):
+        digest.update(b'\0bytes')
+        digest.update(diff)
+    else:
+        digest.update(b'\0str')
+        digest.update(diff.encode('utf-8', errors='surrogatepass'))
+    return digest.digest()
+
+
+def _diff_path(match) -> str:
+    """File path from a diff header match, decoding bytes matches"""
+    path = match.group('file')
+    if isinstance(path, bytes):
+        path = path.decode('utf-8', errors='replace')
+    return path
+
+
+def _primary_change_type(change_types: Dict[str, int]) -> Optional[str]:
+    """Most frequent change type, first seen on ties; None if there are none"""
+    if not change_types:
+        return None
+    # Analyses rebuilt from JSON carry a plain dict rather than a Counter
+    if not isinstance(change_types, Counter):
+        change_types = Counter(change_types)
+    return change_types.most_common(1)[0][0]
+
+
+def _file_count(analysis: Dict) -> int:
+    """Number of changed files, including paths beyond a max_files cap"""
+    if 'total_changed_files' in analysis:
+        return analysis['total_changed_files']
+    return len(analysis.get('changed_files', []))
+
+
+class Analysis(Mapping):
+    """
+    Lazily computed result of PRCreator.analyze_changes(..., lazy=True).
+
+    A read-only mapping with the same keys as the default dict result. Commit
+    fields are computed together on first access to any of them, and diff
+    fields likewise, so a caller that only needs change types never parses
+    the diff.
+    """
+
+    __slots__ = (
+        '_creator', '_commits', '_diff', '_base_ref', '_head_ref', '_repo_path', '_max_files',
+        '_values',
+    )
+
+    KEYS = (
+        'commit_count', 'authors', 'change_types', 'work_items', 'changed_files',
+        'total_changed_files', 'additions', 'deletions', 'breaking_changes',
+    )
+    COMMIT_FIELDS = frozenset(('authors', 'change_types', 'work_items', 'breaking_changes'))
+    DIFF_FIELDS = frozenset(('changed_files', 'total_changed_files', 'additions', 'deletions'))
+
+    def __init__(
+        self,
+        creator: 'PRCreator',
+        commits: List[Dict],
+        diff: Optional[DiffInput] = None,
+        base_ref: Optional[str] = None,
+        head_ref: Optional[str] = None,
+        repo_path: Optional[str] = None,
+        max_files: Optional[int] = None
+    ):
+        self._creator = creator
+        self._commits = commits
+        self._diff = diff
+        self._base_ref = base_ref
+        self._head_ref = head_ref
+        self._repo_path = repo_path
+        self._max_files = max_files
+        self._values = {'commit_count': len(commits)}
+
+    def __getitem__(self, key: str):
+        values = self._values
+        if key not in values:
+            if key in self.COMMIT_FIELDS:
+                values.update(self._creator._analyze_commits(self._commits))
+            elif key in self.DIFF_FIELDS:
+                values.update(self._load_diff())
+            else:
+                raise KeyError(key)
+        return values[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self.KEYS
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+    def __repr__(self) -> str:
+        return f"Analysis({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict:
+        """Compute every field and return a plain dict (e.g., for JSON)"""
+        return dict(self)
+
+    def _load_diff(self) -> Dict:
+        """Ask git for stats when refs are given, else parse the diff"""
+        diff_analysis = None
+        if self._base_ref and self._head_ref:
+            diff_analysis = self._creator._analyze_diff_via_git(
+                self._base_ref, self._head_ref, self._repo_path, self._max_files
+            )
+        if diff_analysis is None and self._diff:
+            diff_analysis = self._creator._analyze_diff(self._diff, self._max_files)
+        self._diff = None
+        return diff_analysis or {
+            'changed_files': [], 'total_changed_files': 0, 'additions': 0, 'deletions': 0,
+        }
 
 
 class PRCreator:
     """Creates pull requests with smart descriptions and reviewer suggestions"""
 
-    def __init__(self):
-        # Common commit message patterns
-        self.feat_pattern = re.compile(r'feat(\([\w-]+\))?:', re.IGNORECASE)
-        self.fix_pattern = re.compile(r'fix(\([\w-]+\))?:', re.IGNORECASE)
-        self.docs_pattern = re.compile(r'docs(\([\w-]+\))?:', re.IGNORECASE)
-        self.refactor_pattern = re.compile(r'refactor(\([\w-]+\))?:', re.IGNORECASE)
-        self.test_pattern = re.compile(r'test(\([\w-]+\))?:', re.IGNORECASE)
-
-        # Work item reference patterns
-        self.work_item_patterns = [
-            re.compile(r'#(\d+)'),  # #1234
-            re.compile(r'AB#(\d+)', re.IGNORECASE),  # AB#1234
-            re.compile(r'(?:fixes?|closes?|resolves?)\s+#(\d+)', re.IGNORECASE),
-        ]
-
-    def analyze_changes(self, commits: List[Dict], diff: Optional[str] = None) -> Dict:
+    def analyze_changes(
+        self,
+        commits: List[Dict],
+        diff: Optional[DiffInput] = None,
+        base_ref: Optional[str] = None,
+        head_ref: Optional[str] = None,
+        repo_path: Optional[str] = None,
+        lazy: bool = False,
+        max_files: Optional[int] = None
+    ) -> Union[Dict, Analysis]:
         """
         Analyze commits and diff to understand changes.
 
+        By default every field is computed and a plain, JSON-serializable
+        dict is returned. With lazy=True an Analysis mapping is returned
+        instead; commit and diff fields are then computed on first read, and
+        to_dict() converts it.
+
         Args:
             commits: List of commit objects with 'message', 'author', 'date'
-            diff: Git diff string (optional)
+            diff: Git diff string, or an iterable of diff lines such as the
+                stdout of a ``git diff`` subprocess (optional)
+            base_ref: Target branch/commit; with head_ref, file stats come
+                from ``git diff --numstat`` instead of parsing ``diff`` (optional)
+            head_ref: Source branch/commit (optional)
+            repo_path: Repository to run git in; defaults to the current
+                working directory (optional)
+            lazy: Return a lazily computed Analysis mapping (optional)
+            max_files: Keep at most this many changed_files paths; every
+                file is still counted in total_changed_files (optional)
 
         Returns:
-            Dict with analysis results
+            Dict (or Analysis mapping if lazy) with analysis results
         """
+        analysis = Analysis(self, commits, diff, base_ref, head_ref, repo_path, max_files)
+        return analysis if lazy else analysis.to_dict()
+
+    def _analyze_commits(self, commits: List[Dict]) -> Dict:
+        """Extract authors, change types, work items and breaking changes"""
+        # Dicts dedupe like sets but keep first-seen order, so output is stable
         analysis = {
-            'commit_count': len(commits),
-            'authors': set(),
-            'change_types': defaultdict(int),
-            'work_items': set(),
-            'changed_files': [],
-            'additions': 0,
-            'deletions': 0,
-            'scope': None,
+            'authors': {},
+            'change_types': Counter(),
+            'work_items': {},
             'breaking_changes': False,
         }
 
-        # Analyze commits
         for commit in commits:
             message = commit.get('message', '')
             author = commit.get('author', 'Unknown')
+            subject = message.split('\n', 1)[0]
 
-            analysis['authors'].add(author)
+            analysis['authors'][author] = None
 
             # Categorize commit type
-            if self.feat_pattern.search(message):
-                analysis['change_types']['feature'] += 1
-            if self.fix_pattern.search(message):
-                analysis['change_types']['fix'] += 1
-            if self.docs_pattern.search(message):
-                analysis['change_types']['docs'] += 1
-            if self.refactor_pattern.search(message):
-                analysis['change_types']['refactor'] += 1
-            if self.test_pattern.search(message):
-                analysis['change_types']['test'] += 1
+            match = _TYPE_RE.match(subject)
+            if match:
+                analysis['change_types'][CHANGE_TYPES[match.group(1).lower()]] += 1
 
             # Extract work items
-            for pattern in self.work_item_patterns:
-                matches = pattern.findall(message)
-                analysis['work_items'].update(matches)
+            analysis['work_items'].update(dict.fromkeys(_WORK_ITEM_RE.findall(message)))
 
             # Check for breaking changes
-            if 'BREAKING CHANGE' in message or '!' in message.split(':')[0]:
+            if 'BREAKING CHANGE' in message or '!' in subject.split(':', 1)[0]:
                 analysis['breaking_changes'] = True
 
-        # Analyze diff if provided
-        if diff:
-            diff_analysis = self._analyze_diff(diff)
-            analysis.update(diff_analysis)
-
-        # Convert sets to lists for JSON serialization
+        # Convert to lists for JSON serialization
         analysis['authors'] = list(analysis['authors'])
         analysis['work_items'] = list(analysis['work_items'])
 
         return analysis
 
-    def _analyze_diff(self, diff: str) -> Dict:
-        """Analyze git diff to extract file changes and stats"""
-        result = {
-            'changed_files': [],
-            'additions': 0,
-            'deletions': 0,
+    def _analyze_diff_via_git(
+        self,
+        base_ref: str,
+        head_ref: str,
+        repo_path: Optional[str] = None,
+        max_files: Optional[int] = None
+    ) -> Optional[Dict]:
+        """
+        Get file changes and stats from ``git diff --numstat``.
+
+        Git reports per-file counts directly, so no diff body is transferred
+        or parsed. Returns None if git is unavailable or the refs are invalid.
+        """
+        # A ref starting with '-' would be parsed by git as an option
+        if base_ref.startswith('-') or head_ref.startswith('-'):
+            return None
+
+        try:
+            proc = subprocess.run(
+                ['git', 'diff', '--numstat', '-z', '--no-renames', f'{base_ref}...{head_ref}'],
+                capture_output=True, text=True, check=True, cwd=repo_path
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+        changed_files = []
+        file_count = additions = deletions = 0
+        max_files = sys.maxsize if max_files is None else max_files
+
+        # Records: "<added>\t<deleted>\t<path>\0"; binary files report "-"
+        for record in proc.stdout.split('\0'):
+            fields = record.split('\t', 2)
+            if len(fields) != 3:
+                continue
+            added, deleted, path = fields
+            file_count += 1
+            if file_count <= max_files:
+                changed_files.append(path)
+            if added != '-':
+                additions += int(added)
+            if deleted != '-':
+                deletions += int(deleted)
+
+        return {
+            'changed_files': changed_files,
+            'total_changed_files': file_count,
+            'additions': additions,
+            'deletions': deletions,
         }
 
-        current_file = None
+    def _analyze_diff(self, diff: DiffInput, max_files: Optional[int] = None) -> Dict:
+        """Analyze git diff to extract file changes and stats"""
+        # One scan over the raw diff; each match is a file header or a +/- line
+        if isinstance(diff, str):
+            return self._count_diff_matches(_DIFF_RE.finditer(diff), max_files)
+        if isinstance(diff, bytes):
+            # Raw git output is scanned without decoding it first
+            return self._count_diff_matches(_DIFF_BYTES_RE.finditer(diff), max_files)
+        return self._analyze_diff_stream(diff, max_files)
+
+    def _analyze_diff_stream(
+        self,
+        lines: Union[Iterable[str], Iterable[bytes]],
+        max_files: Optional[int] = None
+    ) -> Dict:
+        """
+        Analyze a diff one line at a time without holding it in memory.
+
+        Lines may be str or bytes; bytes are only decoded for file paths.
 
-        for line in diff.split('\n'):
-            # Track file changes
-            if line.startswith('diff --git'):
-                # Extract filename from: diff --git a/file.py b/file.py
-                match = re.search(r'b/(.*?)(?:\s|$)', line)
+        Usage:
+            proc = subprocess.Popen(['git', 'diff', 'main...HEAD'],
+                                    stdout=subprocess.PIPE)
+            stats = creator._analyze_diff_stream(proc.stdout)
+        """
+        changed_files = []
+        file_count = additions = deletions = 0
+        max_files = sys.maxsize if max_files is None else max_files
+
+        lines = iter(lines)
+        first_line = next(lines, '')
+        line_type = bytes if isinstance(first_line, bytes) else str
+        (add, delete, header_start,
+         add_header, del_header, file_header, file_re) = _STREAM_MARKERS[line_type]
+
+        # Dispatch on the first character; most lines need one comparison
+        for line in chain((first_line,), lines):
+            first = line[:1]
+            if first == add:
+                if not line.startswith(add_header):
+                    additions += 1
+            elif first == delete:
+                if not line.startswith(del_header):
+                    deletions += 1
+            elif first == header_start and line.startswith(file_header):
+                match = file_re.match(line)
                 if match:
-                    current_file = match.group(1)
-                    result['changed_files'].append(current_file)
-
-            # Count additions/deletions
-            elif line.startswith('+') and not line.startswith('+++'):
-                result['additions'] += 1
-            elif line.startswith('-') and not line.startswith('---'):
-                result['deletions'] += 1
+                    file_count += 1
+                    if file_count <= max_files:
+                        changed_files.append(_diff_path(match))
+
+        return {
+            'changed_files': changed_files,
+            'total_changed_files': file_count,
+            'additions': additions,
+            'deletions': deletions,
+        }
 
-        return result
+    def _count_diff_matches(self, matches: Iterable, max_files: Optional[int] = None) -> Dict:
+        """Tally file headers and +/- lines from _DIFF_RE matches"""
+        changed_files = []
+        file_count = additions = deletions = 0
+        max_files = sys.maxsize if max_files is None else max_files
+
+        for match in matches:
+            kind = match.lastgroup
+            if kind == 'add':
+                additions += 1
+            elif kind == 'del':
+                deletions += 1
+            else:
+                file_count += 1
+                if file_count <= max_files:
+                    changed_files.append(_diff_path(match))
+
+        return {
+            'changed_files': changed_files,
+            'total_changed_files': file_count,
+            'additions': additions,
+            'deletions': deletions,
+        }
 
     def generate_description(
         self,
         commits: List[Dict],
-        diff: Optional[str] = None,
+        diff: Optional[DiffInput] = None,
         analysis: Optional[Dict] = None,
         template: Optional[str] = None
     ) -> str:
@@ -129,15 +450,45 @@ class PRCreator:
 
         Args:
             commits: List of commit objects
-            diff: Git diff string (optional)
+            diff: Git diff string or iterable of diff lines (optional)
             analysis: Pre-computed analysis (optional)
             template: Custom PR template (optional)
 
         Returns:
             Formatted PR description in Markdown
         """
+        # Only inputs that fully determine the output can be cached: no
+        # caller-supplied analysis and no one-shot line iterator
+        if analysis is not None or not (diff is None or isinstance(diff, (str, bytes))):
+            return self._render_description(commits, diff, analysis, template)
+
+        key = _description_key(type(self), commits, diff, template)
+        with _description_cache_lock:
+            description = _description_cache.get(key)
+            if description is not None:
+                _description_cache.move_to_end(key)
+                return description
+
+        # Render outside the lock so concurrent callers are not serialized
+        description = self._render_description(commits, diff, None, template)
+        with _description_cache_lock:
+            _description_cache[key] = description
+            if len(_description_cache) > DESCRIPTION_CACHE_SIZE:
+                _description_cache.popitem(last=False)
+        return description
+
+    def _render_description(
+        self,
+        commits: List[Dict],
+        diff: Optional[DiffInput],
+        analysis: Optional[Dict],
+        template: Optional[str]
+    ) -> str:
+        """Build the PR description (uncached)"""
         if analysis is None:
-            analysis = self.analyze_changes(commits, diff)
+            analysis = self.analyze_changes(
+                commits, diff, lazy=True, max_files=_MAX_TRACKED_FILES
+            )
 
         if template:
             return self._apply_template(template, commits, analysis)
@@ -146,91 +497,72 @@ class PRCreator:
         sections = []
 
         # Summary
-        sections.append("## Summary\n")
-        summary = self._generate_summary(commits, analysis)
-        sections.append(summary + "\n")
+        sections.extend(("## Summary\n", self._generate_summary(commits, analysis) + "\n"))
 
         # Changes
         if analysis['change_types']:
             sections.append("## Changes\n")
-            for change_type, count in analysis['change_types'].items():
-                sections.append(f"- **{change_type.title()}**: {count} commit(s)")
+            sections.extend(
+                f"- **{change_type.title()}**: {count} commit(s)"
+                for change_type, count in analysis['change_types'].items()
+            )
             sections.append("")
 
         # Detailed changes list
         sections.append("## What Changed\n")
         for commit in commits[:10]:  # Limit to first 10 commits
-            message = commit.get('message', '').split('\n')[0]  # First line only
+            message = commit.get('message', '').split('\n', 1)[0]  # First line only
             sections.append(f"- {message}")
         if len(commits) > 10:
             sections.append(f"- ...and {len(commits) - 10} more commits")
         sections.append("")
 
         # Files changed
-        if analysis.get('changed_files'):
-            sections.append("## Files Changed\n")
-            sections.append(f"**{len(analysis['changed_files'])}** files modified ")
-            sections.append(f"(+{analysis['additions']} additions, -{analysis['deletions']} deletions)\n")
+        file_count = _file_count(analysis)
+        if file_count:
+            sections.extend((
+                "## Files Changed\n",
+                f"**{file_count}** files modified ",
+                f"(+{analysis['additions']} additions, -{analysis['deletions']} deletions)\n",
+            ))
 
             # Show top 10 files
-            for file in analysis['changed_files'][:10]:
-                sections.append(f"- `{file}`")
-            if len(analysis['changed_files']) > 10:
-                sections.append(f"- ...and {len(analysis['changed_files']) - 10} more files")
+            sections.extend(f"- `{file}`" for file in analysis['changed_files'][:10])
+            if file_count > 10:
+                sections.append(f"- ...and {file_count - 10} more files")
             sections.append("")
 
         # Testing checklist
-        sections.append("## Testing\n")
-        sections.append("- [ ] Unit tests added/updated")
-        sections.append("- [ ] Integration tests pass")
-        sections.append("- [ ] Manual testing completed")
-        sections.append("- [ ] No breaking changes (or documented if present)")
-        sections.append("")
+        sections.extend(_TESTING_CHECKLIST)
 
         # Breaking changes warning
         if analysis['breaking_changes']:
-            sections.append("## ⚠️ Breaking Changes\n")
-            sections.append("This PR contains breaking changes. Please review carefully.\n")
+            sections.extend((
+                "## ⚠️ Breaking Changes\n",
+                "This PR contains breaking changes. Please review carefully.\n",
+            ))
 
         # Related work items
         if analysis['work_items']:
             sections.append("## Related Work Items\n")
-            for work_item in analysis['work_items']:
-                sections.append(f"- Closes #{work_item}")
+            sections.extend(f"- Closes #{work_item}" for work_item in analysis['work_items'])
             sections.append("")
 
         # Footer
-        sections.append("---")
-        sections.append(f"*Generated by Claude Code (Azure DevOps PR Manager)*")
+        sections.extend(_DESCRIPTION_FOOTER)
 
         return '\n'.join(sections)
 
     def _generate_summary(self, commits: List[Dict], analysis: Dict) -> str:
         """Generate a concise summary of the changes"""
-        change_types = analysis['change_types']
-
         # Determine primary change type
-        if change_types:
-            primary_type = max(change_types, key=change_types.get)
-        else:
-            primary_type = 'update'
+        primary_type = _primary_change_type(analysis['change_types']) or 'update'
 
         commit_count = analysis['commit_count']
-        file_count = len(analysis.get('changed_files', []))
+        file_count = _file_count(analysis)
 
         # Build summary
-        parts = []
-
-        if primary_type == 'feature':
-            parts.append("This PR adds new features")
-        elif primary_type == 'fix':
-            parts.append("This PR fixes bugs")
-        elif primary_type == 'refactor':
-            parts.append("This PR refactors code")
-        elif primary_type == 'docs':
-            parts.append("This PR updates documentation")
-        else:
-            parts.append("This PR makes changes")
+        parts = [_SUMMARY_OPENINGS.get(primary_type, "This PR makes changes")]
 
         if commit_count == 1:
             parts.append("in 1 commit")
@@ -253,7 +585,7 @@ class PRCreator:
         # Available template variables
         variables = {
             'commit_count': analysis['commit_count'],
-            'file_count': len(analysis.get('changed_files', [])),
+            'file_count': _file_count(analysis),
             'additions': analysis.get('additions', 0),
             'deletions': analysis.get('deletions', 0),
             'work_items': ', '.join(analysis.get('work_items', [])),
@@ -292,31 +624,27 @@ class PRCreator:
         # Parse CODEOWNERS file
         if codeowners_content:
             codeowners = self._parse_codeowners(codeowners_content)
-            for file_path in changed_files:
-                owners = self._match_codeowners(file_path, codeowners)
-                reviewers.update(owners)
+            reviewers.update(self._match_codeowners_all(changed_files, codeowners))
 
         # Use git blame data
         if git_blame_data:
-            author_counts = defaultdict(int)
+            author_counts = Counter()
             for file_path in changed_files:
-                authors = git_blame_data.get(file_path, [])
-                for author in authors:
-                    author_counts[author] += 1
+                author_counts.update(git_blame_data.get(file_path, ()))
 
             # Get top contributors
-            top_contributors = sorted(
-                author_counts.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:max_reviewers]
-            reviewers.update([author for author, _ in top_contributors])
+            reviewers.update(author for author, _ in author_counts.most_common(max_reviewers))
 
         # Limit to max_reviewers
         return list(reviewers)[:max_reviewers]
 
     def _parse_codeowners(self, content: str) -> List[tuple]:
-        """Parse CODEOWNERS file into (pattern, owners) tuples"""
+        """
+        Parse CODEOWNERS file into (compiled pattern, owners, dir_scoped) tuples.
+
+        dir_scoped marks patterns such as ``src/api/`` or ``docs/**`` whose
+        result depends only on a file's directory, not its name.
+        """
         codeowners = []
 
         for line in content.split('\n'):
@@ -328,29 +656,66 @@ class PRCreator:
             # Format: pattern @owner1 @owner2
             parts = line.split()
             if len(parts) >= 2:
-                pattern = parts[0]
+                pattern = self._compile_pattern(parts[0])
                 owners = [o.lstrip('@') for o in parts[1:] if o.startswith('@')]
-                codeowners.append((pattern, owners))
+                dir_scoped = parts[0].rstrip('*').endswith('/')
+                codeowners.append((pattern, owners, dir_scoped))
 
         return codeowners
 
-    def _match_codeowners(self, file_path: str, codeowners: List[tuple]) -> Set[str]:
-        """Match file path against CODEOWNERS patterns"""
-        owners = set()
+    def _match_codeowners_all(self, changed_files: List[str], codeowners: List[tuple]) -> Set[str]:
+        """
+        Union of CODEOWNERS owners across all changed files.
 
-        for pattern, pattern_owners in codeowners:
-            # Simple glob-like matching
-            if self._matches_pattern(file_path, pattern):
-                owners.update(pattern_owners)
+        Each entry is dropped once it has matched, since its owners are then
+        already included. Directory-scoped entries are tested once per
+        directory ("src/api/") rather than once per file.
+        """
+        owners = set()
+        dir_entries = [(p, o) for p, o, dir_scoped in codeowners if dir_scoped]
+        file_entries = [(p, o) for p, o, dir_scoped in codeowners if not dir_scoped]
+        seen_dirs = set()
+
+        for file_path in changed_files:
+            if not (dir_entries or file_entries):
+                break
+
+            if dir_entries:
+                directory = file_path[:file_path.rfind('/') + 1]
+                if directory not in seen_dirs:
+                    seen_dirs.add(directory)
+                    unmatched = []
+                    for pattern, pattern_owners in dir_entries:
+                        if pattern.fullmatch(directory):
+                            owners.update(pattern_owners)
+                        else:
+                            unmatched.append((pattern, pattern_owners))
+                    dir_entries = unmatched
+
+            if file_entries:
+                unmatched = []
+                for pattern, pattern_owners in file_entries:
+                    if pattern.fullmatch(file_path):
+                        owners.update(pattern_owners)
+                    else:
+                        unmatched.append((pattern, pattern_owners))
+                file_entries = unmatched
 
         return owners
 
-    def _matches_pattern(self, file_path: str, pattern: str) -> bool:
-        """Check if file path matches CODEOWNERS pattern"""
-        # Convert glob pattern to regex
-        # Simple implementation - can be enhanced
-        pattern_regex = pattern.replace('*', '.*').replace('?', '.')
-        return bool(re.match(pattern_regex, file_path))
+    def _compile_pattern(self, pattern: str) -> Pattern:
+        """
+        Compile a CODEOWNERS pattern once, when the file is parsed.
+
+        fnmatch.translate escapes regex metacharacters and avoids the
+        backtracking blow-up of rewriting '*' as '.*'. The result is used with
+        fullmatch; a pattern also covers everything below a directory it names.
+        """
+        if pattern.endswith('/'):
+            # Directory pattern: only what is below it
+            return re.compile(fnmatch.translate(pattern + '*'))
+        # The path itself, or anything below it if it names a directory
+        return re.compile(f"{fnmatch.translate(pattern)}|{fnmatch.translate(pattern + '/*')}")
 
     def generate_title(self, commits: List[Dict], analysis: Optional[Dict] = None) -> str:
         """
@@ -366,32 +731,16 @@ class PRCreator:
         if not commits:
             return "Pull request"
 
-        if analysis is None:
-            analysis = self.analyze_changes(commits, None)
-
-        # If single commit, use its message
+        # If single commit, use its message; no analysis needed
         if len(commits) == 1:
-            message = commits[0].get('message', '').split('\n')[0]
+            message = commits[0].get('message', '').split('\n', 1)[0]
             return message[:100]  # Limit to 100 chars
 
+        if analysis is None:
+            analysis = self.analyze_changes(commits, None, lazy=True)
+
         # Multiple commits - generate summary title
-        change_types = analysis['change_types']
-
-        if change_types:
-            primary_type = max(change_types, key=change_types.get)
-
-            if primary_type == 'feature':
-                prefix = "feat:"
-            elif primary_type == 'fix':
-                prefix = "fix:"
-            elif primary_type == 'refactor':
-                prefix = "refactor:"
-            elif primary_type == 'docs':
-                prefix = "docs:"
-            else:
-                prefix = ""
-        else:
-            prefix = ""
+        prefix = _TITLE_PREFIXES.get(_primary_change_type(analysis['change_types']), "")
 
         # Try to extract common scope or theme
         first_commit = commits[0].get('message', '').split('\n')[0]
@@ -404,7 +753,7 @@ class PRCreator:
 
 def create_pr_description(
     commits: List[Dict],
-    diff: Optional[str] = None,
+    diff: Optional[DiffInput] = None,
     template: Optional[str] = None
 ) -> str:
     """
@@ -416,9 +765,30 @@ def create_pr_description(
             diff=git_diff_output
         )
     """
+    return PRCreator().generate_description(commits, diff, template=template)
+
+
+def create_pr_descriptions(
+    pr_batch: Iterable[Tuple[List[Dict], Optional[DiffInput], Optional[str]]]
+) -> List[str]:
+    """
+    Create descriptions for many PRs with one shared PRCreator.
+
+    PRs are processed one at a time, so a batch of large streamed diffs is
+    never resident at once; repeated (commits, diff, template) inputs are
+    served from the description cache.
+
+    Usage:
+        descriptions = create_pr_descriptions([
+            (commits_a, diff_a, None),
+            (commits_b, diff_b, template),
+        ])
+    """
     creator = PRCreator()
-    analysis = creator.analyze_changes(commits, diff)
-    return creator.generate_description(commits, diff, analysis, template)
+    return [
+        creator.generate_description(commits, diff, template=template)
+        for commits, diff, template in pr_batch
+    ]
 
 
 if __name__ == '__main__':
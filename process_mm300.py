@@ -5,15 +5,28 @@ Uses create-msft-bugreport skill
 """
 import json
 from datetime import datetime
+from pathlib import Path
+
+class _FilenameTable(dict):
+    """str.translate table: keeps alphanumerics, '-' and '_'; maps the rest to '-'"""
+
+    def __missing__(self, codepoint):
+        # Non-ASCII characters are classified on first use, then cached
+        char = chr(codepoint)
+        self[codepoint] = char if char.isalnum() else '-'
+        return self[codepoint]
+
+_FILENAME_TABLE = _FilenameTable(
+    (i, chr(i) if chr(i).isalnum() or chr(i) in '-_' else '-') for i in range(128)
+)
 
 def sanitize_filename(text):
     """Convert text to safe filename"""
-    return ''.join(c if c.isalnum() or c in '-_' else '-' for c in text.lower())[:50]
+    return text.lower().translate(_FILENAME_TABLE)[:50]
 
 def main():
-    # Load JIRA data
-    with open('migrated-bugs/MM-300-jira-data.json', 'r', encoding='utf-8') as f:
-        jira_data = json.load(f)
+    # Load JIRA data (one read; json decodes the UTF-8 bytes directly)
+    jira_data = json.loads(Path('migrated-bugs/MM-300-jira-data.json').read_bytes())
 
     fields = jira_data['fields']
     issue_key = jira_data['key']
@@ -36,8 +49,8 @@ def main():
     filename_safe_title = sanitize_filename(title)
     output_filename = f"migrated-bugs/{issue_key}-{timestamp}-{filename_safe_title}.md"
 
-    # Build GitHub markdown
-    github_report = f"""# [BUG] {title}
+    # Build GitHub markdown; pieces are joined once at the end
+    parts = [f"""# [BUG] {title}
 
 **Source**: Migrated from JIRA [MM-300](https://rightrez.atlassian.net/browse/MM-300)
 **Project**: {project}
@@ -80,15 +93,15 @@ OperationIDs are being reused across multiple callback operations after migratin
 
 The issue is documented with 3 screenshots showing the telemetry differences:
 
-"""
+"""]
 
     # Add attachment links
-    for i, attachment in enumerate(attachments, 1):
-        filename = attachment.get('filename', f'attachment-{i}')
-        content_url = attachment.get('content', '')
-        github_report += f"{i}. [{filename}]({content_url})\n"
+    parts.extend(
+        f"{i}. [{attachment.get('filename', f'attachment-{i}')}]({attachment.get('content', '')})\n"
+        for i, attachment in enumerate(attachments, 1)
+    )
 
-    github_report += f"""
+    parts.append(f"""
 ## Azure Portal Links
 
 Investigation links from the original email:
@@ -168,7 +181,8 @@ Multiple callbacks share the same OperationID, causing:
 **Issue Type**: Spike (Research)
 
 This issue requires investigation to identify why Azure Functions isolated mode is reusing OperationIDs instead of generating unique IDs for each callback operation.
-"""
+""")
+    github_report = ''.join(parts)
 
     # Write the file
     with open(output_filename, 'w', encoding='utf-8') as f: